@@ -1,6 +1,7 @@
 from __future__ import annotations
-from typing import TypedDict, TYPE_CHECKING, Any
+from typing import TYPE_CHECKING  # , Any, TypedDict
 from abc import ABC  # , abstractmethod
+from dataclasses import dataclass
 import enum
 
 if TYPE_CHECKING:
@@ -21,7 +22,8 @@ class ProcessType(enum.Enum):
     # Add more process types as needed.
 
 
-class ProcessContext(TypedDict, total=True):
+@dataclass(frozen=True, slots=True)
+class ProcessContext:
     """
     'Children' that are spawned by a process should always have the
     following attributes passed in to them as part of their context.
@@ -30,10 +32,14 @@ class ProcessContext(TypedDict, total=True):
     sessions to 1) have access to all services directly through
     self properties, and 2) access their own unique process identifiers
     that is used to track them in the system, if they need to do so.
-    
+
     Remember that that process "children" here refers to things spawned
     by the process, but not the process itself (ie an app process
     needs to spawn its own Textual widget).
+
+    A frozen slotted dataclass: the context fields back properties that are
+    read from event handlers constantly, and slot loads skip the per-key
+    dict hashing a TypedDict would pay.
     """
 
     process_type: ProcessType
@@ -61,6 +67,11 @@ class AceOfBase(ABC):
     process in TDE (including services, screens, etc) a unique identifier.
     """
 
+    # Empty slots: the ABC stores nothing per-instance itself, and this lets
+    # subclasses that declare __slots__ actually run dict-free. Subclasses
+    # that don't declare slots keep their __dict__ as usual.
+    __slots__ = ()
+
     BROKEN: bool = False  # Indicates if the app is broken and cannot be launched.
     MISSING_METHODS: frozenset[str] | None = None  # Set of missing abstract methods, if any.
 
@@ -76,7 +87,7 @@ class AceOfBase(ABC):
         return self.uid
 
     @property
-    def log(self, *args: Any, **kwargs: Any) -> Logger:
+    def log(self) -> Logger:
         """
         Log a message using the Textual log system.
 
@@ -109,14 +120,11 @@ class AceOfBase(ABC):
             )
 
     @classmethod
-    def validate_stage2(cls, required_members: dict[str, str]) -> None:
-
-        for attr_name, kind in required_members.items():
+    def validate_stage2(cls, required_members: tuple[tuple[str, str], ...]) -> None:
 
-            try:
-                attr = getattr(cls, attr_name)
-            except AttributeError:
+        # A missing attribute and an unset (None) attribute mean the same
+        # thing here, so a default-getattr covers both without paying the
+        # AttributeError raise/catch machinery for absent members.
+        for attr_name, kind in required_members:
+            if getattr(cls, attr_name, None) is None:
                 raise NotImplementedError(f"{cls.__name__} must implement {attr_name} ({kind}).")
-            else:
-                if attr is None:
-                    raise NotImplementedError(f"{cls.__name__} must implement {attr_name} ({kind}).")
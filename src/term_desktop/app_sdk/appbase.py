@@ -85,6 +85,15 @@ class TDEAppBase(AceOfBase):
     APP_ID: str | None = None
     APP_AUTHOR: str | None = None
 
+    # Members checked by validate(); a preallocated constant so each
+    # validation call skips rebuilding the mapping.
+    REQUIRED_MEMBERS: tuple[tuple[str, str], ...] = (
+        ("APP_NAME", "class attribute"),
+        ("APP_ID", "class attribute"),
+        ("APP_AUTHOR", "class attribute"),
+        # more will go here as needed
+    )
+
     @abstractmethod
     def launch_mode(self) -> LaunchMode:
         """Returns the launch mode for the app.
@@ -229,14 +238,8 @@ class TDEAppBase(AceOfBase):
         but with a warning that it cannot be launched. We can then easily expand that
         to add more information that the user could click on to see what is missing.
         """
-        required_members = {
-            "APP_NAME": "class attribute",
-            "APP_ID": "class attribute",
-            "APP_AUTHOR": "class attribute",
-            # more will go here as needed
-        }
         cls.validate_stage1()
-        cls.validate_stage2(required_members)
+        cls.validate_stage2(cls.REQUIRED_MEMBERS)
 
     @property
     def default_window_settings(cls) -> DefaultWindowSettings:
@@ -301,19 +304,19 @@ class TDEMainWidget(Widget):
 
     @property
     def process_type(self) -> ProcessType:
-        return self._process_context["process_type"]
+        return self._process_context.process_type
 
     @property
     def process_id(self) -> str:
-        return self._process_context["process_id"]
+        return self._process_context.process_id
 
     @property
     def process_uid(self) -> str:
-        return self._process_context["process_uid"]
+        return self._process_context.process_uid
 
     @property
     def services(self) -> ServicesManager:
-        return self._process_context["services"]
+        return self._process_context.services
 
     @property
     def window_process_id(self) -> str | None:
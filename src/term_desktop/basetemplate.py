@@ -59,15 +59,16 @@ class FooBase(AceOfBase):
     def validate(cls) -> None:
 
         # You can also add class level attributes that must be
-        # implemented by subclasses:
+        # implemented by subclasses (define REQUIRED_MEMBERS as a class-level
+        # constant so it is not rebuilt on every validation call):
 
-        # required_members = {
-        #     "FOO_NAME": "class attribute",
-        #     "FOO_ID": "class attribute",
-        # }
+        # REQUIRED_MEMBERS: tuple[tuple[str, str], ...] = (
+        #     ("FOO_NAME", "class attribute"),
+        #     ("FOO_ID", "class attribute"),
+        # )
 
         cls.validate_stage1()
-        # cls.validate_stage2(required_members)
+        # cls.validate_stage2(cls.REQUIRED_MEMBERS)
 
 
 class TDEWidgetFoo(Widget):
@@ -87,19 +88,19 @@ class TDEWidgetFoo(Widget):
 
     @property
     def process_type(self) -> ProcessType:
-        return self._process_context["process_type"]
+        return self._process_context.process_type
 
     @property
     def process_id(self) -> str:
-        return self._process_context["process_id"]
+        return self._process_context.process_id
 
     @property
     def process_uid(self) -> str:
-        return self._process_context["process_uid"]
+        return self._process_context.process_uid
 
     @property
     def services(self) -> ServicesManager:
-        return self._process_context["services"]
+        return self._process_context.services
 
     def post_initialized(self) -> None:
         """This method is called by the FooService when the WidgetFoo is mounted.
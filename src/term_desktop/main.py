@@ -7,7 +7,10 @@ import sys
 import inspect
 
 # from time import time
+import atexit
 import logging
+import logging.handlers
+import queue
 
 if TYPE_CHECKING:
     from textual.app import ComposeResult
@@ -41,10 +44,17 @@ from term_desktop.common.exceptions import TDEException
 #################
 
 
+# None of our log output includes thread/process fields, so skip the
+# per-record threading/os.getpid() lookups that logging does by default.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-file_handler = logging.FileHandler("app.log")
+# Size-based rotation keeps app.log bounded without ever rewriting it in place.
+file_handler = logging.handlers.RotatingFileHandler("app.log", maxBytes=512_000, backupCount=1)
 file_handler.setLevel(logging.INFO)
 
 # Create console handler (optional - for both file and console output)
@@ -58,9 +68,30 @@ formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s", datef
 file_handler.setFormatter(formatter)
 console_handler.setFormatter(formatter)
 
-# Add handlers to logger
-logger.addHandler(file_handler)
-logger.addHandler(console_handler)
+# The real handlers live behind a queue so that emitting a log line only costs
+# a put_nowait() on the caller's thread (which is usually the event loop thread).
+# The listener thread does the actual formatting and write()/flush() work.
+log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+
+# The file handler gets an in-memory buffer in front of it so that the listener
+# thread only pays one write()+flush() per 64 records instead of one per record.
+# Anything at ERROR or above (and shutdown) flushes the buffer immediately.
+buffered_file_handler = logging.handlers.MemoryHandler(
+    capacity=64,
+    flushLevel=logging.ERROR,
+    target=file_handler,
+)
+queue_listener = logging.handlers.QueueListener(
+    log_queue,
+    buffered_file_handler,
+    console_handler,
+    respect_handler_level=True,
+)
+queue_listener.start()
+atexit.register(queue_listener.stop)
+
+# Add the queue handler to the logger
+logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
 logger.debug("This is a debug message")
 logger.info("This is an info message")
@@ -27,6 +27,13 @@ class TDEScreenBase(AceOfBase):
 
     SCREEN_ID: str | None = None
 
+    # Members checked by validate(); a preallocated constant so each
+    # validation call skips rebuilding the mapping.
+    REQUIRED_MEMBERS: tuple[tuple[str, str], ...] = (
+        ("SCREEN_ID", "class attribute"),
+        # more will go here as needed
+    )
+
     def __init__(self, process_id: str, instance_num: int) -> None:
         """The process ID is set by the screen service when it initializes the screen process.
 
@@ -47,12 +54,8 @@ class TDEScreenBase(AceOfBase):
     @classmethod
     def validate(cls) -> None:
 
-        required_members = {
-            "SCREEN_ID": "class attribute",
-            # more will go here as needed
-        }
         cls.validate_stage1()
-        cls.validate_stage2(required_members)
+        cls.validate_stage2(cls.REQUIRED_MEMBERS)
 
 
 class TDEScreen(Screen[None]):
@@ -86,19 +89,19 @@ class TDEScreen(Screen[None]):
 
     @property
     def process_type(self) -> ProcessType:
-        return self._process_context["process_type"]
+        return self._process_context.process_type
 
     @property
     def process_id(self) -> str:
-        return self._process_context["process_id"]
+        return self._process_context.process_id
 
     @property
     def process_uid(self) -> str:
-        return self._process_context["process_uid"]
+        return self._process_context.process_uid
 
     @property
     def services(self) -> ServicesManager:
-        return self._process_context["services"]
+        return self._process_context.services
 
     def post_initialized(self) -> None:
         """This method is called by the ScreenService when the screen is mounted.
@@ -13,7 +13,6 @@ import asyncio
 
 if TYPE_CHECKING:
     from term_desktop.services.servicesmanager import ServicesManager
-    from term_desktop.services.windows import WindowService
     from term_desktop.app_sdk import TDEAppBase
 
 # Textual imports
@@ -21,6 +20,7 @@ from textual.worker import WorkerError
 
 # Local imports
 from term_desktop.services.servicebase import TDEServiceBase
+from term_desktop.services.windows import WindowService
 from term_desktop.aceofbase import ProcessContext, ProcessType
 from term_desktop.app_sdk import LaunchMode
 from term_desktop.app_sdk.appbase import (
@@ -57,6 +57,7 @@ class AppService(TDEServiceBase[TDEAppBase]):
         self.validate()
         self._content_instance_dict: dict[str, TDEMainWidget] = {}
         self._registered_apps: dict[str, type[TDEAppBase]] = {}
+        self._registered_apps_items: tuple[tuple[str, type[TDEAppBase]], ...] = ()
         self._failed_apps: dict[str, Exception] = {}
 
         spec = importlib.util.find_spec("term_desktop.apps")
@@ -99,6 +100,10 @@ class AppService(TDEServiceBase[TDEAppBase]):
             self.log.error(f"Failed to discover apps: {str(e)}")
             raise e
         else:
+            # Frozen snapshot for consumers that iterate the registry (e.g. the
+            # start menu at shell startup) - the registry is immutable between
+            # discovery runs, so hand out a tuple instead of live dict views.
+            self._registered_apps_items = tuple(self._registered_apps.items())
             if len(self.registered_apps) == 0:
                 self.log.error("Loader 'worked', but no apps were discovered. Must have malfunctioned.")
                 return True
@@ -114,6 +119,7 @@ class AppService(TDEServiceBase[TDEAppBase]):
         self._processes.clear()
         self._instance_counter.clear()
         self._registered_apps.clear()
+        self._registered_apps_items = ()
         return True
 
     ####################
@@ -132,6 +138,16 @@ class AppService(TDEServiceBase[TDEAppBase]):
         """
         return self._registered_apps
 
+    @property
+    def registered_apps_items(self) -> tuple[tuple[str, type[TDEAppBase]], ...]:
+        """
+        Get the registered apps as a frozen (app_id, app_class) tuple.
+
+        Returns:
+            Snapshot taken when discovery finished; cheap to iterate repeatedly.
+        """
+        return self._registered_apps_items
+
     @property
     def failed_apps(self) -> dict[str, Exception]:
         """
@@ -279,12 +295,12 @@ class AppService(TDEServiceBase[TDEAppBase]):
             ) from e
 
         # Stage 4: Create the app context dictionary
-        app_context: ProcessContext = {
-            "process_type": ProcessType.APP,
-            "process_id": process_id,
-            "process_uid": app_process.uid,
-            "services": self.services_manager,
-        }
+        app_context = ProcessContext(
+            process_type=ProcessType.APP,
+            process_id=process_id,
+            process_uid=app_process.uid,
+            services=self.services_manager,
+        )
 
         launch_mode = app_process.launch_mode()
         if launch_mode == LaunchMode.WINDOW:
@@ -325,14 +341,14 @@ class AppService(TDEServiceBase[TDEAppBase]):
             custom_window_mounts = app_process.custom_window_mounts()
             window_styles = app_process.window_styles()
 
-            window_meta: WindowService.WindowMeta = {
-                "content_instance": content_instance,
-                "app_process_id": process_id,
-                "window_dict": window_settings,
-                "styles_dict": window_styles,
-                "custom_mounts": custom_window_mounts,
-                "callback_id": "main_desktop",  # This is the main desktop callback ID
-            }
+            window_meta = WindowService.WindowMeta(
+                content_instance=content_instance,
+                app_process_id=process_id,
+                window_dict=window_settings,
+                styles_dict=window_styles,
+                custom_mounts=custom_window_mounts,
+                callback_id="main_desktop",  # This is the main desktop callback ID
+            )
 
             await self.services_manager.window_service.request_new_window(window_meta=window_meta)
 
@@ -476,11 +492,18 @@ class AppService(TDEServiceBase[TDEAppBase]):
             raise ImportError(f"Failed to load module for app {module_name}: {str(e)}") from e
 
         ### ~ Stage 3: Retrieve the app class from module ~ ###
+        # Underscored names (__builtins__, __doc__, etc) and non-type values are
+        # filtered out before the issubclass MRO walk (NOTE: the bases use ABCMeta,
+        # so the type check must be isinstance rather than a `type(cls) is type` test) - most module attributes
+        # are imports or dunders, not candidate classes.
         try:
             AppClass = next(
                 cls
-                for _name_, cls in module.__dict__.items()
-                if isinstance(cls, type) and issubclass(cls, TDEAppBase) and cls is not TDEAppBase
+                for name, cls in module.__dict__.items()
+                if not name.startswith("_")
+                and isinstance(cls, type)
+                and issubclass(cls, TDEAppBase)
+                and cls is not TDEAppBase
             )
         except StopIteration:
             raise ImportError(
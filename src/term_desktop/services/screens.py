@@ -235,12 +235,12 @@ class ScreenService(TDEServiceBase[TDEScreenBase]):
             ) from e
 
         # Stage 4: Create the screen context dictionary
-        screen_context: ProcessContext = {
-            "process_type": ProcessType.SCREEN,
-            "process_id": process_id,
-            "process_uid": screen_process.uid,
-            "services": self.services_manager,
-        }
+        screen_context = ProcessContext(
+            process_type=ProcessType.SCREEN,
+            process_id=process_id,
+            process_uid=screen_process.uid,
+            services=self.services_manager,
+        )
 
         # Stage 5: Get screen class definition from process instance
         try:
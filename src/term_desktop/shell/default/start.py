@@ -11,6 +11,7 @@ if TYPE_CHECKING:
 
 
 # Textual imports
+from rich.text import Text
 from textual import on  # , work
 from textual.app import ComposeResult
 from textual.geometry import Offset
@@ -28,6 +29,17 @@ from textual_slidecontainer import SlideContainer
 
 class StartMenu(SlideContainer):
 
+    # Cache of built Options, keyed by the identity of the registered_apps
+    # dict, so re-mounting the menu (theme switch, shell restart) reuses the
+    # entries instead of rebuilding them.
+    _options_cache: list[Option] | None = None
+    _options_cache_key: int | None = None
+
+    # Offsets are immutable value objects - pre-allocate the two dock
+    # positions instead of building a new Offset on every dock toggle.
+    _OFFSET_TOP = Offset(0, 0)
+    _OFFSET_BOTTOM = Offset(0, -1)
+
     def __init__(self, services: ServicesManager) -> None:
         super().__init__(
             slide_direction="down",
@@ -39,7 +51,7 @@ class StartMenu(SlideContainer):
         )
         self.services = services
         self.registered_apps: dict[str, type[TDEAppBase]] = {}
-        self.taskbar_offset = Offset(0, -1)
+        self.taskbar_offset = self._OFFSET_BOTTOM
 
     def compose(self) -> ComposeResult:
         option_list = OptionList(id="start_menu_list")
@@ -48,12 +60,32 @@ class StartMenu(SlideContainer):
 
     def on_mount(self) -> None:
         self.registered_apps = self.services.app_service.registered_apps
+        # Pre-bound for option_selected: one LOAD_ATTR chain instead of three
+        # on every launch click.
+        self._request_app_launch = self.services.app_service.request_app_launch
+        self._apps_get = self.registered_apps.get
         self.load_registered_apps(self.registered_apps)
 
     def load_registered_apps(self, registered_apps: dict[str, type[TDEAppBase]]) -> None:
         self.log.debug("Loading registered apps into start menu.")
 
-        options = [Option(f"{value.APP_NAME}\n", key) for key, value in registered_apps.items()]
+        if StartMenu._options_cache is not None and StartMenu._options_cache_key == id(registered_apps):
+            options = StartMenu._options_cache
+        else:
+            # Plain pre-built Text: app names are never markup, and no_wrap
+            # spares the OptionList re-measuring the lines per render pass.
+            # The service's frozen snapshot is used when the caller passed the
+            # live registry (the normal case); any other dict is honored as-is.
+            if registered_apps is self.services.app_service.registered_apps:
+                apps_items = self.services.app_service.registered_apps_items
+            else:
+                apps_items = tuple(registered_apps.items())
+            options = [
+                Option(Text(f"{value.APP_NAME}\n", no_wrap=True), key)
+                for key, value in apps_items
+            ]
+            StartMenu._options_cache = options
+            StartMenu._options_cache_key = id(registered_apps)
         self.query_one(OptionList).add_options(options)
 
     #####################
@@ -64,10 +96,10 @@ class StartMenu(SlideContainer):
     def option_selected(self, event: OptionList.OptionSelected) -> None:
 
         if event.option_id:
-            tde_app_type = self.registered_apps.get(event.option_id)
+            tde_app_type = self._apps_get(event.option_id)
             if tde_app_type:
                 self.log.debug(f"Launching app: {tde_app_type.APP_NAME} ({event.option_id})")
-                self.services.app_service.request_app_launch(tde_app_type)
+                self._request_app_launch(tde_app_type)
             self.close()
 
     @on(SlideContainer.SlideCompleted)
@@ -82,6 +114,11 @@ class StartMenu(SlideContainer):
             option_list.can_focus = False
             event.container.query().blur()
 
+    def _slide_open_completed(self) -> None:
+        # Bound method rather than a closure built inside _slide_open, so
+        # opening the menu doesn't allocate a new function object per slide.
+        self.post_message(self.SlideCompleted(True, self))
+
     #! OVERRIDE
     async def _slide_open(self) -> None:
 
@@ -89,23 +126,35 @@ class StartMenu(SlideContainer):
         if self.state is not True:
             self.set_reactive(SlideContainer.state, True)  # set state without calling the watcher
 
-        def slide_open_completed() -> None:
-            self.post_message(self.SlideCompleted(True, self))
-
         # if not self.floating:
+        duration = self.duration
+        easing = self.easing_function
         self.display = True
+
+        target = self.taskbar_offset
+        delta = target - self.offset
+        if delta.x == 0 and abs(delta.y) <= 1:
+            # Within one cell of the open position (e.g. re-opening after a
+            # dock flip): a tween over a 1-cell move buys nothing visually, so
+            # snap and skip the animator bookkeeping. The fade below still runs.
+            self.offset = target
+            if self.fade:
+                self.styles.animate("opacity", value=1.0, duration=duration, easing=easing)
+            self.call_after_refresh(self._slide_open_completed)
+            return
+
         self.animate(
             "offset",
             value=cast(
                 Animatable, self.taskbar_offset
             ),  # <-- This line modified from original in SlideContainer
-            duration=self.duration,
-            easing=self.easing_function,
-            on_complete=slide_open_completed,
+            duration=duration,
+            easing=easing,
+            on_complete=self._slide_open_completed,
         )
         if self.fade:
             self.styles.animate(
-                "opacity", value=1.0, duration=self.duration, easing=self.easing_function
+                "opacity", value=1.0, duration=duration, easing=easing
             )  # reset to original opacity
 
     def shift_ui_for_taskbar(self, dock: str) -> None:
@@ -113,8 +162,8 @@ class StartMenu(SlideContainer):
         # jump_clicker: type[MainScreen]  # noqa: F842 # type: ignore
 
         if dock == "top":
-            self.taskbar_offset = Offset(0, 0)
+            self.taskbar_offset = self._OFFSET_TOP
         elif dock == "bottom":
-            self.taskbar_offset = Offset(0, -1)
+            self.taskbar_offset = self._OFFSET_BOTTOM
         else:
             self.log.error(f"Unknown dock position: {dock}")
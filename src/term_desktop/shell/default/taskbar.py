@@ -2,13 +2,15 @@
 
 # python standard library imports
 from __future__ import annotations
-from typing import TYPE_CHECKING  # , Any
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     # from textual.visual import VisualType
     import textual.events as events
 
 # Textual imports
+from textual.reactive import reactive
+
 # from textual import on
 # from textual.widgets import Static
 # from textual.css.query import NoMatches
@@ -25,26 +27,46 @@ from term_desktop.common.messages import ToggleStartMenu, ToggleExplorer
 
 class TaskBarButton(NoSelectStatic):
 
+    # Reactive press state: assignments that don't change the value are no-ops,
+    # and the resulting class toggle/repaint is batched by Textual instead of
+    # restyling immediately on every add_class/remove_class call.
+    pressed: reactive[bool] = reactive(False)
+    right_pressed: reactive[bool] = reactive(False)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        # Contract check runs once per subclass definition instead of per
+        # button instantiation (three buttons per TaskBar mount).
+        super().__init_subclass__(**kwargs)
+        if not any("on_mouse_up" in base.__dict__ for base in cls.__mro__):
+            raise NotImplementedError(f"{cls.__name__} must implement the on_mouse_up method.")
+
     def __init__(self, content: str, id: str, window_bar: WindowBar) -> None:
         super().__init__(content=content, id=id)
         self.window_bar = window_bar
         self.click_started_on: bool = False
 
-        if not hasattr(self, "on_mouse_up"):
-            raise NotImplementedError(f"{self.__class__.__name__} must implement the on_mouse_up method.")
+    def watch_pressed(self, pressed: bool) -> None:
+        self.set_class(pressed, "pressed")
+
+    def watch_right_pressed(self, right_pressed: bool) -> None:
+        self.set_class(right_pressed, "right_pressed")
+
+    def release(self) -> None:
+        """Clear both press states (shared by the on_mouse_up handlers)."""
+        self.pressed = False
+        self.right_pressed = False
 
     def on_mouse_down(self, event: events.MouseDown) -> None:
 
         if event.button == 1:  # left click
-            self.add_class("pressed")
+            self.pressed = True
         elif event.button == 2 or event.button == 3:  # middle or right click
-            self.add_class("right_pressed")
+            self.right_pressed = True
         self.click_started_on = True
 
     def on_leave(self, event: events.Leave) -> None:
 
-        self.remove_class("pressed")
-        self.remove_class("right_pressed")
+        self.release()
         self.click_started_on = False
 
 
@@ -59,8 +81,7 @@ class StartButton(TaskBarButton):
 
     async def on_mouse_up(self, event: events.MouseUp) -> None:
 
-        self.remove_class("pressed")
-        self.remove_class("right_pressed")
+        self.release()
         if self.click_started_on:
             if event.button == 1:  # left click
                 self.post_message(ToggleStartMenu())
@@ -81,8 +102,7 @@ class ExplorerButton(TaskBarButton):
 
     async def on_mouse_up(self, event: events.MouseUp) -> None:
 
-        self.remove_class("pressed")
-        self.remove_class("right_pressed")
+        self.release()
         if self.click_started_on:
             if event.button == 1:  # left click
                 self.post_message(ToggleExplorer())
@@ -103,8 +123,7 @@ class CommandPaletteButton(TaskBarButton):
 
     async def on_mouse_up(self, event: events.MouseUp) -> None:
 
-        self.remove_class("pressed")
-        self.remove_class("right_pressed")
+        self.release()
         if self.click_started_on:
             if event.button == 1:  # left click
                 await self.app.run_action("command_palette")
@@ -117,21 +136,26 @@ class CommandPaletteButton(TaskBarButton):
 class TaskBar(WindowBar):
 
     async def on_mount(self) -> None:
+        # Both left-side buttons go in with a single anchored mount (one layout
+        # pass instead of one per button), and the anchors are only queried once.
+        start_button = StartButton(window_bar=self)
+        explorer_button = ExplorerButton(window_bar=self)
         await self.mount(
-            StartButton(window_bar=self),
-            before=self.query_one("#windowbar_button_left"),
-        )
-        await self.mount(
-            ExplorerButton(window_bar=self),
+            start_button,
+            explorer_button,
             before=self.query_one("#windowbar_button_left"),
         )
         await self.mount(
             CommandPaletteButton(window_bar=self),
             after=self.query_one("#windowbar_button_right"),
         )
+        # Kept for refresh_buttons so it repaints without re-querying the DOM.
+        self._start_button = start_button
+        self._explorer_button = explorer_button
 
     def refresh_buttons(self) -> None:
         """This exists to fix a graphical glitch."""
 
-        self.query_one("#start_button").refresh()
-        self.query_one("#explorer_button").refresh()
+        # Repaint only - no layout pass is needed to fix the glitch.
+        self._start_button.refresh(layout=False)
+        self._explorer_button.refresh(layout=False)
@@ -54,6 +54,17 @@ class TDEShellBase(AceOfBase):
     DESCRIPTION: str | None = None
     SHELL_AUTHOR: str | None = None
 
+    # Members checked by validate(); a preallocated constant so each
+    # validation call skips rebuilding the mapping.
+    REQUIRED_MEMBERS: tuple[tuple[str, str], ...] = (
+        ("SHELL_ID", "class attribute"),
+        ("SHELL_NAME", "class attribute"),
+        ("SHELL_AUTHOR", "class attribute"),
+        ("ICON", "class attribute"),
+        ("DESCRIPTION", "class attribute"),
+        # more will go here as needed
+    )
+
     @abstractmethod
     def get_shell_session(self) -> type[TDEShellSession]:
         """build me"""
@@ -91,16 +102,8 @@ class TDEShellBase(AceOfBase):
     @classmethod
     def validate(cls) -> None:
 
-        required_members = {
-            "SHELL_ID": "class attribute",
-            "SHELL_NAME": "class attribute",
-            "SHELL_AUTHOR": "class attribute",
-            "ICON": "class attribute",
-            "DESCRIPTION": "class attribute",
-            # more will go here as needed
-        }
         cls.validate_stage1()
-        cls.validate_stage2(required_members)
+        cls.validate_stage2(cls.REQUIRED_MEMBERS)
 
     async def kill(self) -> None:
         # N/I yet
@@ -139,6 +142,32 @@ class TDEShellSession(Widget):
             self.mounting_callback,
             callback_id="main_desktop",
         )
+        # Set lazily in _get_start_button - the TaskBar mounts its buttons in
+        # its own on_mount, which may not have run yet when ours does.
+        self._start_button: Widget | None = None
+        # Snapshot of the start menu subtree (widget ids), built when the menu
+        # finishes opening so handle_click tests membership in O(1) instead of
+        # re-walking the subtree per click. None while the menu is closed.
+        self._start_menu_widgets: set[int] | None = None
+        # Toggle requests arriving within the same frame tick are coalesced so
+        # a burst of clicks produces one toggle instead of an open/close storm.
+        self._pending_toggles: set[str] = set()
+        self._toggle_flush_scheduled = False
+
+    def on_mount(self) -> None:
+        # The default components are queried constantly by the mouse and action
+        # handlers below, so look each one up once instead of walking the DOM
+        # on every event.
+        self._start_menu = self.query_one(StartMenu)
+        self._task_bar = self.query_one(TaskBar)
+        self._file_explorer = self.query_one(FileExplorer)
+        self._path_bar = self.query_one(ExplorerPathBar)
+        self._desktop = self.query_one(Desktop)
+
+    def _get_start_button(self) -> Widget:
+        if self._start_button is None:
+            self._start_button = self._task_bar.query_one("#start_button")
+        return self._start_button
 
     def compose(self) -> ComposeResult:
 
@@ -164,7 +193,7 @@ class TDEShellSession(Widget):
     # Someone might want to override this to mount them into a different
     # container or to do some other logic (perhaps for a tiling manager or something).
     async def mounting_callback(self, window: Window) -> None:
-        await self.query_one(Desktop).mount(window)
+        await self._desktop.mount(window)
 
     # This will be called by the shell service when the shell session is initialized.
     def post_initialized(self) -> None:
@@ -213,19 +242,19 @@ class TDEShellSession(Widget):
 
     @property
     def process_type(self) -> ProcessType:
-        return self._process_context["process_type"]
+        return self._process_context.process_type
 
     @property
     def process_id(self) -> str:
-        return self._process_context["process_id"]
+        return self._process_context.process_id
 
     @property
     def process_uid(self) -> str:
-        return self._process_context["process_uid"]
+        return self._process_context.process_uid
 
     @property
     def services(self) -> ServicesManager:
-        return self._process_context["services"]
+        return self._process_context.services
 
     ###############
     # ~ Actions ~ #
@@ -234,25 +263,50 @@ class TDEShellSession(Widget):
     @on(ToggleTaskBar)
     def action_toggle_windowbar(self) -> None:
         """Toggle the visibility of the window bar."""
-        self.query_one(TaskBar).toggle_bar()
+        self._queue_toggle("windowbar")
 
     @on(ToggleWindowSwitcher)
     def action_toggle_windowswitcher(self) -> None:
         """Toggle the visibility of the window switcher."""
-        self.push_window_switcher()
+        self._queue_toggle("windowswitcher")
 
     @on(ToggleExplorer)
     def action_toggle_explorer(self) -> None:
         """Toggle the visibility of Slide Menu 1."""
-        explorer = self.query_one(FileExplorer)
-        path_bar = self.query_one(ExplorerPathBar)
-        explorer.toggle()
-        path_bar.toggle()
+        self._queue_toggle("explorer")
 
     @on(ToggleStartMenu)
     def action_toggle_startmenu(self) -> None:
         """Open the start menu / quick launcher."""
-        self.query_one(StartMenu).toggle()
+        self._queue_toggle("startmenu")
+
+    def _queue_toggle(self, name: str) -> None:
+        """Coalesce toggle requests to at most one per frame (60 fps tick).
+
+        Repeated posts of the same toggle within one tick collapse into a
+        single action, so rapid-fire clicks can't queue an open/close backlog.
+        """
+        self._pending_toggles.add(name)
+        if not self._toggle_flush_scheduled:
+            self._toggle_flush_scheduled = True
+            self.set_timer(1 / 60, self._flush_toggles)
+
+    def _flush_toggles(self) -> None:
+
+        pending, self._pending_toggles = self._pending_toggles, set()
+        self._toggle_flush_scheduled = False
+        if "windowbar" in pending:
+            self._task_bar.toggle_bar()
+        if "windowswitcher" in pending:
+            self.push_window_switcher()
+        if "explorer" in pending:
+            # The explorer and its path bar always move together; batching the
+            # two toggles yields one screen update instead of two.
+            with self.app.batch_update():
+                self._file_explorer.toggle()
+                self._path_bar.toggle()
+        if "startmenu" in pending:
+            self._start_menu.toggle()
 
     ####################
     # ~ Other Events ~ #
@@ -263,30 +317,47 @@ class TDEShellSession(Widget):
         """This method exists to make the start menu close if someone clicks
         elsewhere on the screen while it is open"""
 
-        start_menu = self.query_one(StartMenu)
+        start_menu = self._start_menu
         if not start_menu.state:  # if its currently closed, do nothing.
             return
         if event.widget:
+            start_menu_widgets = self._start_menu_widgets
+            if start_menu_widgets is not None:
+                # O(1) membership test against the cached subtree snapshot.
+                inside_menu = id(event.widget) in start_menu_widgets
+            else:
+                # Click arrived mid-animation, before the snapshot was built.
+                # Walking the ancestor chain is O(depth), not O(subtree).
+                inside_menu = start_menu in event.widget.ancestors_with_self
             if (
-                event.widget is not self.query_one(StartMenu)  # not the start menu
-                and event.widget not in start_menu.query().results()  # not inside the start menu
-                and event.widget is not self.query_one(TaskBar).query_one("#start_button")
+                event.widget is not start_menu  # not the start menu
+                and not inside_menu  # not inside the start menu
+                and event.widget is not self._get_start_button()
             ):
                 await self.run_action("toggle_startmenu")
 
     @on(TaskBar.DockToggled)
     def taskbar_dock_toggled(self, event: TaskBar.DockToggled) -> None:
 
-        self.query_one(FileExplorer).shift_ui_for_taskbar(event.dock)
-        self.query_one(ExplorerPathBar).shift_ui_for_taskbar(event.dock)
-        self.query_one(StartMenu).shift_ui_for_taskbar(event.dock)
+        self._file_explorer.shift_ui_for_taskbar(event.dock)
+        self._path_bar.shift_ui_for_taskbar(event.dock)
+        self._start_menu.shift_ui_for_taskbar(event.dock)
+
+    @on(SlideContainer.SlideCompleted, "StartMenu")
+    def slide_completed_startmenu(self, event: SlideContainer.SlideCompleted) -> None:
+
+        if event.state:
+            self._start_menu_widgets = {
+                id(widget) for widget in self._start_menu.walk_children(with_self=True)
+            }
+        else:
+            self._start_menu_widgets = None
 
     @on(SlideContainer.SlideCompleted, "FileExplorer")
     def slide_completed_explorer(self, event: SlideContainer.SlideCompleted) -> None:
 
         if not event.state:
-            taskbar = self.query_one(TaskBar)
-            taskbar.refresh_buttons()  # this is to fix a graphical glitch.
+            self._task_bar.refresh_buttons()  # this is to fix a graphical glitch.
 
     @on(DirectoryTree.FileSelected)
     def file_selected(self, event: DirectoryTree.FileSelected) -> None:
@@ -299,7 +370,6 @@ class TDEShellSession(Widget):
     def node_highlighted(self, event: DirectoryTree.NodeHighlighted[DirEntry]) -> None:
 
         if event.node.data:
-            path_bar = self.query_one(ExplorerPathBar)
-            path_bar.update_path(event.node.data.path)
+            self._path_bar.update_path(event.node.data.path)
         else:
             self.log.error("Node data is None, cannot update path.")
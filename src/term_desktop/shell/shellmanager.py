@@ -2,7 +2,7 @@
 
 # python standard library imports
 from __future__ import annotations
-from typing import TYPE_CHECKING  # , cast
+from typing import TYPE_CHECKING, Callable  # , cast
 
 if TYPE_CHECKING:
     # from textual.app import ComposeResult
@@ -29,6 +29,9 @@ class ShellManager(Widget):
         self.services.shell_service.register_mounting_callback(self.mounting_callback)
         self.registered_shells = self.services.shell_service.registered_shells
         self.current_shell: TDEShellSession | None = None
+        # Bound-method dispatch table for the forwarded toggle actions, built
+        # when a shell is mounted so each forward is one dict lookup + call.
+        self._forwards: dict[str, Callable[[], None]] | None = None
         self.load_registered_shells(self.registered_shells)
 
     @property
@@ -41,13 +44,17 @@ class ShellManager(Widget):
     async def mounting_callback(self, shell: TDEShellSession) -> None:
         await self.mount(shell)
         self.current_shell = shell
+        self._forwards = {
+            "windowbar": shell.action_toggle_windowbar,
+            "windowswitcher": shell.action_toggle_windowswitcher,
+            "explorer": shell.action_toggle_explorer,
+            "startmenu": shell.action_toggle_startmenu,
+        }
 
     def load_registered_shells(self, registered_shells: dict[str, type[TDEShellBase]]) -> None:
 
-        registred_shells_str = ""
-        for key, value in registered_shells.items():
-            registred_shells_str += f"{key} -> {value.SHELL_NAME}\n"
-        self.log.info(f"Registered shells in Shell Manager:\n{registred_shells_str}")
+        lines = [f"{key} -> {value.SHELL_NAME}" for key, value in registered_shells.items()]
+        self.log.info("Registered shells in Shell Manager:\n" + "\n".join(lines))
 
     def load_chosen_shell(self) -> None:
         # There is no chosen shell at the moment. Only the default shell is available.
@@ -58,26 +65,27 @@ class ShellManager(Widget):
     # ~ Actions ~ #
     ###############
 
+    def _forward(self, name: str) -> None:
+        # No-op until a shell has been mounted.
+        if self._forwards is not None:
+            self._forwards[name]()
+
     # @on(ToggleTaskBar)
     def action_toggle_windowbar(self) -> None:
         """Toggle the visibility of the window bar."""
-        if self.current_shell is not None:
-            self.current_shell.action_toggle_windowbar()
+        self._forward("windowbar")
 
     # @on(ToggleWindowSwitcher)
     def action_toggle_windowswitcher(self) -> None:
         """Toggle the visibility of the window switcher."""
-        if self.current_shell is not None:
-            self.current_shell.action_toggle_windowswitcher()
+        self._forward("windowswitcher")
 
     # @on(ToggleExplorer)
     def action_toggle_explorer(self) -> None:
         """Toggle the visibility of Slide Menu 1."""
-        if self.current_shell is not None:
-            self.current_shell.action_toggle_explorer()
+        self._forward("explorer")
 
     # @on(ToggleStartMenu)
     def action_toggle_startmenu(self) -> None:
         """Open the start menu / quick launcher."""
-        if self.current_shell is not None:
-            self.current_shell.action_toggle_startmenu()
+        self._forward("startmenu")
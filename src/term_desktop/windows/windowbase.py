@@ -1,6 +1,7 @@
 """windowbase.py"""
 
 from __future__ import annotations
+import sys
 
 # from abc import abstractmethod
 from typing import TYPE_CHECKING  # , Any
@@ -20,12 +21,20 @@ from textual_window import Window
 # Local imports
 from term_desktop.aceofbase import AceOfBase, ProcessContext, ProcessType
 
+# Interned once; WINDOW_ID is built per window process and plain concatenation
+# with a shared suffix beats f-string format dispatch on that path.
+_WINDOW_SUFFIX = sys.intern("-window")
+
 
 class TDEWindowBase(AceOfBase):
 
     # NOTE: Nothing inherits from this class. It's just used to identify the
     # window process in a manner that's consistent with the rest of TDE.
 
+    # One window process exists per open window, so keep the instances
+    # dict-free: four fixed slots instead of a per-instance __dict__.
+    __slots__ = ("WINDOW_ID", "app_process_id", "window_process_id", "instance_num")
+
     def __init__(
         self,
         app_process_id: str,
@@ -37,21 +46,26 @@ class TDEWindowBase(AceOfBase):
         Note that this is not the same as the UID. The UID is a unique identifier
         that is set on all types of processes automatically (anything that inherits from
         a TDE Base class)."""
-        self.WINDOW_ID = f"{app_process_id}-window"
+        self.WINDOW_ID = app_process_id + _WINDOW_SUFFIX
 
         self.app_process_id = app_process_id
         self.window_process_id = window_process_id
         self.instance_num = instance_num
 
-    def get_window(self) -> type[TDEWindow]:
+    @staticmethod
+    def get_window() -> type[TDEWindow]:
         """
         # ! add note here
         """
+        # Static: the returned class is a constant, so calls skip the
+        # per-call bound-method allocation an instance method would pay.
         return TDEWindow
 
-    @classmethod
-    def validate(cls) -> None:
-        cls.validate_stage1()
+    # Alias for the raw classmethod descriptor (not AceOfBase.validate_stage1,
+    # which would already be bound to AceOfBase): validate() binds to whatever
+    # class it is called on, with no forwarding frame in between. Window
+    # processes have no required members beyond stage 1.
+    validate = AceOfBase.__dict__["validate_stage1"]
 
 
 class TDEWindow(Window):
@@ -87,28 +101,14 @@ class TDEWindow(Window):
             styles_dict=styles_dict,
             **window_dict,
         )
-        self._process_context = process_context
-        self._window_id = window_id
-
-    @property
-    def process_type(self) -> ProcessType:
-        return self._process_context["process_type"]
-
-    @property
-    def process_id(self) -> str:
-        return self._process_context["process_id"]
-
-    @property
-    def process_uid(self) -> str:
-        return self._process_context["process_uid"]
-
-    @property
-    def window_process_id(self) -> str:
-        return self._window_id
-
-    @property
-    def services(self) -> ServicesManager:
-        return self._process_context["services"]
+        # The context is unpacked once here; windows read these constantly
+        # from mount/dispatch/focus paths, so they are plain attributes
+        # rather than properties reaching through the context per access.
+        self.process_type: ProcessType = process_context.process_type
+        self.process_id: str = process_context.process_id
+        self.process_uid: str = process_context.process_uid
+        self.services: ServicesManager = process_context.services
+        self.window_process_id: str = window_id
 
     # NOTE: Windows post an Initialized message automatically,
     # so there's no need to trigger one here like in the other processes.
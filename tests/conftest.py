@@ -0,0 +1,19 @@
+"""Shared fixtures for the test suite."""
+
+import pytest_asyncio
+
+from term_desktop.main import TermDesktop
+
+
+@pytest_asyncio.fixture(loop_scope="module", scope="module")
+async def pilot():
+    """A running TermDesktop app shared by every test in a module.
+
+    Booting the full desktop (services, shell, taskbar) dominates test wall
+    time, so it is paid once per module instead of once per test. Tests get
+    the pilot and drive the already-running app.
+    """
+    app = TermDesktop()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        yield pilot
@@ -1,15 +1,12 @@
 # from pathlib import Path
-# from textual.pilot import Pilot
-from term_desktop.main import TermDesktop
+from textual.pilot import Pilot
 # from .app_test import WindowTestApp
 
-async def test_launch():  
-    """Test launching the WindowDemo app."""
-    app = TermDesktop()
-    async with app.run_test() as pilot:
-        await pilot.pause()
-        await pilot.exit(None) 
 
+async def test_launch(pilot: Pilot[None]):
+    """Test launching the app (uses the shared module-scoped fixture)."""
+    await pilot.pause()
+    assert pilot.app.is_running
 
 
 # APP_DIR = Path(__file__).parent
@@ -25,4 +22,4 @@ async def test_launch():
 #         APP_DIR / "app_test.py",
 #         terminal_size=TERINAL_SIZE,
 #         run_before=run_before,
-#     )
\ No newline at end of file
+#     )